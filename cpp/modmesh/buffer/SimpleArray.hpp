@@ -33,6 +33,15 @@
 #include <limits>
 #include <stdexcept>
 
+// Runtime-dispatched SIMD kernels are only emitted for x86-64 with a
+// compiler that supports the target attribute and __builtin_cpu_supports.
+// On aarch64 NEON is part of the baseline ISA, so the portable loops
+// already vectorize without a dispatched variant.
+#if (defined(__x86_64__) || defined(__amd64__)) && (defined(__GNUC__) || defined(__clang__))
+#define MODMESH_SIMD_DISPATCH_X86 1
+#include <immintrin.h>
+#endif
+
 #if defined(_MSC_VER)
 #include <BaseTsd.h>
 typedef SSIZE_T ssize_t;
@@ -110,12 +119,747 @@ public:
     A & fill(value_type const & value)
     {
         auto athis = static_cast<A *>(this);
-        std::fill(athis->begin(), athis->end(), value);
+        if (athis->is_c_contiguous())
+        {
+            std::fill(athis->begin(), athis->end(), value);
+        }
+        else
+        {
+            // A non-contiguous view shares its buffer with other data;
+            // write only the elements the shape and stride select.
+            using shape_type = typename A::shape_type;
+            for (size_t d = 0; d < athis->ndim(); ++d)
+            {
+                if (0 == athis->shape(d))
+                {
+                    return *athis;
+                }
+            }
+            shape_type idx(athis->ndim(), 0);
+            while (true)
+            {
+                size_t offset = 0;
+                for (size_t d = 0; d < athis->ndim(); ++d)
+                {
+                    offset += idx[d] * athis->stride(d);
+                }
+                athis->data(offset) = value;
+                size_t d = athis->ndim();
+                bool done = false;
+                while (true)
+                {
+                    if (0 == d)
+                    {
+                        done = true;
+                        break;
+                    }
+                    --d;
+                    if (++idx[d] < athis->shape(d))
+                    {
+                        break;
+                    }
+                    idx[d] = 0;
+                }
+                if (done)
+                {
+                    break;
+                }
+            }
+        }
         return *athis;
     }
 
 }; /* end class SimpleArrayMixinModifiers */
 
+/**
+ * Kahan-compensated scalar accumulation.  Used for single-precision tails
+ * where a plain running sum would drop the low-order bits of small addends.
+ */
+template <typename T>
+T sum_kahan(T const * __restrict ptr, size_t n, T initial)
+{
+    T sum = initial;
+    T c = 0;
+    for (size_t i = 0; i < n; ++i)
+    {
+        const T y = ptr[i] - c;
+        const T t = sum + y;
+        c = (t - sum) - y;
+        sum = t;
+    }
+    return sum;
+}
+
+/**
+ * Straight-line pairwise sum of exactly N elements, fully unrolled at
+ * compile time.  For tiny arrays this removes the loop setup and the
+ * variable-trip-count tail branch that otherwise dominate the call.
+ */
+template <size_t N, typename T>
+inline T sum_fixed(T const * __restrict ptr)
+{
+    if constexpr (1 == N)
+    {
+        return ptr[0];
+    }
+    else
+    {
+        constexpr size_t H = N / 2;
+        return sum_fixed<H>(ptr) + sum_fixed<N - H>(ptr + H);
+    }
+}
+
+/// Upper bound (inclusive) for the sum_small() unrolled dispatch.
+constexpr size_t SMALL_SUM_MAX = 32;
+
+/**
+ * Dispatch 1 <= n <= SMALL_SUM_MAX to the unrolled sum_fixed instance.  The
+ * switch collapses to a jump table; each case is straight-line code.
+ */
+template <typename T>
+inline T sum_small(T const * __restrict ptr, size_t n)
+{
+// NOLINTNEXTLINE(cppcoreguidelines-macro-usage)
+#define MM_DECL_SUM_SMALL_CASE(N) \
+    case (N): \
+        return sum_fixed<(N)>(ptr)
+    switch (n)
+    {
+        MM_DECL_SUM_SMALL_CASE(1);
+        MM_DECL_SUM_SMALL_CASE(2);
+        MM_DECL_SUM_SMALL_CASE(3);
+        MM_DECL_SUM_SMALL_CASE(4);
+        MM_DECL_SUM_SMALL_CASE(5);
+        MM_DECL_SUM_SMALL_CASE(6);
+        MM_DECL_SUM_SMALL_CASE(7);
+        MM_DECL_SUM_SMALL_CASE(8);
+        MM_DECL_SUM_SMALL_CASE(9);
+        MM_DECL_SUM_SMALL_CASE(10);
+        MM_DECL_SUM_SMALL_CASE(11);
+        MM_DECL_SUM_SMALL_CASE(12);
+        MM_DECL_SUM_SMALL_CASE(13);
+        MM_DECL_SUM_SMALL_CASE(14);
+        MM_DECL_SUM_SMALL_CASE(15);
+        MM_DECL_SUM_SMALL_CASE(16);
+        MM_DECL_SUM_SMALL_CASE(17);
+        MM_DECL_SUM_SMALL_CASE(18);
+        MM_DECL_SUM_SMALL_CASE(19);
+        MM_DECL_SUM_SMALL_CASE(20);
+        MM_DECL_SUM_SMALL_CASE(21);
+        MM_DECL_SUM_SMALL_CASE(22);
+        MM_DECL_SUM_SMALL_CASE(23);
+        MM_DECL_SUM_SMALL_CASE(24);
+        MM_DECL_SUM_SMALL_CASE(25);
+        MM_DECL_SUM_SMALL_CASE(26);
+        MM_DECL_SUM_SMALL_CASE(27);
+        MM_DECL_SUM_SMALL_CASE(28);
+        MM_DECL_SUM_SMALL_CASE(29);
+        MM_DECL_SUM_SMALL_CASE(30);
+        MM_DECL_SUM_SMALL_CASE(31);
+        MM_DECL_SUM_SMALL_CASE(32);
+    default:
+        return T();
+    }
+#undef MM_DECL_SUM_SMALL_CASE
+}
+
+/**
+ * Sum a contiguous block of memory.  Four independent accumulators break the
+ * floating-point addition dependency chain so that the compiler can keep
+ * multiple adds in flight (and vectorize the loop when the target allows it).
+ */
+template <typename T>
+T sum_contiguous(T const * __restrict ptr, size_t n)
+{
+    T acc0 = 0;
+    T acc1 = 0;
+    T acc2 = 0;
+    T acc3 = 0;
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4)
+    {
+        acc0 += ptr[i];
+        acc1 += ptr[i + 1];
+        acc2 += ptr[i + 2];
+        acc3 += ptr[i + 3];
+    }
+    if constexpr (std::is_same_v<float, std::remove_const_t<T>>)
+    {
+        return sum_kahan(ptr + i, n - i, (acc0 + acc1) + (acc2 + acc3));
+    }
+    else
+    {
+        for (; i < n; ++i)
+        {
+            acc0 += ptr[i];
+        }
+        return (acc0 + acc1) + (acc2 + acc3);
+    }
+}
+
+#if defined(MODMESH_SIMD_DISPATCH_X86)
+
+__attribute__((target("avx2"))) inline float sum_contiguous_avx2(float const * __restrict ptr, size_t n)
+{
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    __m256 acc2 = _mm256_setzero_ps();
+    __m256 acc3 = _mm256_setzero_ps();
+    size_t i = 0;
+    for (; i + 32 <= n; i += 32)
+    {
+        acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(ptr + i));
+        acc1 = _mm256_add_ps(acc1, _mm256_loadu_ps(ptr + i + 8));
+        acc2 = _mm256_add_ps(acc2, _mm256_loadu_ps(ptr + i + 16));
+        acc3 = _mm256_add_ps(acc3, _mm256_loadu_ps(ptr + i + 24));
+    }
+    acc0 = _mm256_add_ps(_mm256_add_ps(acc0, acc1), _mm256_add_ps(acc2, acc3));
+    // Shuffle-and-add tree; HADDPS decodes to more uops than a shuffle
+    // plus a vertical add and serializes the reduction tail.
+    __m128 acc = _mm_add_ps(_mm256_castps256_ps128(acc0), _mm256_extractf128_ps(acc0, 1));
+    acc = _mm_add_ps(acc, _mm_movehl_ps(acc, acc));
+    acc = _mm_add_ss(acc, _mm_shuffle_ps(acc, acc, 0x55));
+    return sum_kahan(ptr + i, n - i, _mm_cvtss_f32(acc));
+}
+
+__attribute__((target("avx2"))) inline double sum_contiguous_avx2(double const * __restrict ptr, size_t n)
+{
+    __m256d acc0 = _mm256_setzero_pd();
+    __m256d acc1 = _mm256_setzero_pd();
+    __m256d acc2 = _mm256_setzero_pd();
+    __m256d acc3 = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16)
+    {
+        acc0 = _mm256_add_pd(acc0, _mm256_loadu_pd(ptr + i));
+        acc1 = _mm256_add_pd(acc1, _mm256_loadu_pd(ptr + i + 4));
+        acc2 = _mm256_add_pd(acc2, _mm256_loadu_pd(ptr + i + 8));
+        acc3 = _mm256_add_pd(acc3, _mm256_loadu_pd(ptr + i + 12));
+    }
+    acc0 = _mm256_add_pd(_mm256_add_pd(acc0, acc1), _mm256_add_pd(acc2, acc3));
+    // Shuffle-and-add tree instead of the slower HADDPD.
+    __m128d acc = _mm_add_pd(_mm256_castpd256_pd128(acc0), _mm256_extractf128_pd(acc0, 1));
+    double ret = _mm_cvtsd_f64(_mm_add_sd(acc, _mm_unpackhi_pd(acc, acc)));
+    for (; i < n; ++i)
+    {
+        ret += ptr[i];
+    }
+    return ret;
+}
+
+__attribute__((target("avx512f"))) inline float sum_contiguous_avx512(float const * __restrict ptr, size_t n)
+{
+    __m512 acc0 = _mm512_setzero_ps();
+    __m512 acc1 = _mm512_setzero_ps();
+    __m512 acc2 = _mm512_setzero_ps();
+    __m512 acc3 = _mm512_setzero_ps();
+    size_t i = 0;
+    for (; i + 64 <= n; i += 64)
+    {
+        acc0 = _mm512_add_ps(acc0, _mm512_loadu_ps(ptr + i));
+        acc1 = _mm512_add_ps(acc1, _mm512_loadu_ps(ptr + i + 16));
+        acc2 = _mm512_add_ps(acc2, _mm512_loadu_ps(ptr + i + 32));
+        acc3 = _mm512_add_ps(acc3, _mm512_loadu_ps(ptr + i + 48));
+    }
+    acc0 = _mm512_add_ps(_mm512_add_ps(acc0, acc1), _mm512_add_ps(acc2, acc3));
+    return sum_kahan(ptr + i, n - i, _mm512_reduce_add_ps(acc0));
+}
+
+__attribute__((target("avx512f"))) inline double sum_contiguous_avx512(double const * __restrict ptr, size_t n)
+{
+    __m512d acc0 = _mm512_setzero_pd();
+    __m512d acc1 = _mm512_setzero_pd();
+    __m512d acc2 = _mm512_setzero_pd();
+    __m512d acc3 = _mm512_setzero_pd();
+    size_t i = 0;
+    for (; i + 32 <= n; i += 32)
+    {
+        acc0 = _mm512_add_pd(acc0, _mm512_loadu_pd(ptr + i));
+        acc1 = _mm512_add_pd(acc1, _mm512_loadu_pd(ptr + i + 8));
+        acc2 = _mm512_add_pd(acc2, _mm512_loadu_pd(ptr + i + 16));
+        acc3 = _mm512_add_pd(acc3, _mm512_loadu_pd(ptr + i + 24));
+    }
+    acc0 = _mm512_add_pd(_mm512_add_pd(acc0, acc1), _mm512_add_pd(acc2, acc3));
+    double ret = _mm512_reduce_add_pd(acc0);
+    for (; i < n; ++i)
+    {
+        ret += ptr[i];
+    }
+    return ret;
+}
+
+/**
+ * Dispatch overloads resolved once per process through CPUID.  The widest
+ * ISA supported by the running machine wins; the portable template above is
+ * the fallback, so a binary built on a new machine still runs on an old one.
+ */
+inline float sum_contiguous(float const * ptr, size_t n)
+{
+    using fn_type = float (*)(float const *, size_t);
+    static const fn_type impl = []()
+    {
+        if (__builtin_cpu_supports("avx512f"))
+        {
+            return static_cast<fn_type>(sum_contiguous_avx512);
+        }
+        if (__builtin_cpu_supports("avx2"))
+        {
+            return static_cast<fn_type>(sum_contiguous_avx2);
+        }
+        return static_cast<fn_type>(sum_contiguous<float>);
+    }();
+    return impl(ptr, n);
+}
+
+inline double sum_contiguous(double const * ptr, size_t n)
+{
+    using fn_type = double (*)(double const *, size_t);
+    static const fn_type impl = []()
+    {
+        if (__builtin_cpu_supports("avx512f"))
+        {
+            return static_cast<fn_type>(sum_contiguous_avx512);
+        }
+        if (__builtin_cpu_supports("avx2"))
+        {
+            return static_cast<fn_type>(sum_contiguous_avx2);
+        }
+        return static_cast<fn_type>(sum_contiguous<double>);
+    }();
+    return impl(ptr, n);
+}
+
+#endif /* MODMESH_SIMD_DISPATCH_X86 */
+
+/**
+ * NumPy-style pairwise (cascaded) summation.  Halve the range until a block
+ * is small enough for the straight-line kernel, then add the partial sums in
+ * a balanced tree.  The rounding error grows with log(n) instead of n, so a
+ * large reduction stays within the same error envelope as numpy.mean().  The
+ * recursion depth is logarithmic in n and does not threaten the stack.
+ */
+template <typename T>
+T sum_pairwise(T const * __restrict ptr, size_t n)
+{
+    constexpr size_t blocksize = 128;
+    if (n <= blocksize)
+    {
+        return sum_contiguous(ptr, n);
+    }
+    const size_t half = n / 2;
+    return sum_pairwise(ptr, half) + sum_pairwise(ptr + half, n - half);
+}
+
+#ifdef _OPENMP
+
+/// Reductions below this element count are not worth the fork/join cost of
+/// an OpenMP parallel region; with one full block per thread at minimum the
+/// region amortizes even on wide machines.
+constexpr size_t OMP_SUM_THRESHOLD = 1 << 16;
+
+/**
+ * OpenMP-parallel contiguous sum.  The range is cut into fixed-size blocks
+ * reduced pairwise per thread; static scheduling keeps each thread on the
+ * contiguous chunk it first touched, which is also the friendly layout for
+ * first-touch NUMA page placement.  Each block's partial lands in a slot
+ * indexed by block, and the partials are combined pairwise in block order
+ * afterwards, so the result is bitwise identical for any thread count.
+ */
+template <typename T>
+T sum_parallel(T const * __restrict ptr, size_t n)
+{
+    constexpr size_t blocksize = 1 << 16;
+    const ssize_t nblock = static_cast<ssize_t>(n / blocksize);
+    std::unique_ptr<T[]> const partial(new T[nblock > 0 ? nblock : 1]);
+#pragma omp parallel for schedule(static)
+    for (ssize_t b = 0; b < nblock; ++b)
+    {
+        partial[b] = sum_pairwise(ptr + b * blocksize, blocksize);
+    }
+    T total = sum_pairwise(partial.get(), static_cast<size_t>(nblock));
+    total += sum_pairwise(ptr + nblock * blocksize, n - nblock * blocksize);
+    return total;
+}
+
+#endif /* _OPENMP */
+
+/**
+ * Straight-line reduction of one strided block.  Four independent
+ * accumulators keep multiple adds in flight so the strided loads do not
+ * serialize on one floating-point add chain.  When every load lands on
+ * its own cache line the hardware stride prefetcher stops covering the
+ * pattern and each iteration eats the full demand-fetch latency; ask for
+ * the lines a few iterations ahead.  Prefetch does not fault, so no
+ * bounds check is needed at the tail.
+ */
+template <typename T>
+T sum_strided_block(T const * __restrict ptr, size_t n, size_t stride)
+{
+    constexpr size_t prefetch_dist = 8;
+    const bool want_prefetch = stride * sizeof(T) >= 64;
+    T acc0 = 0;
+    T acc1 = 0;
+    T acc2 = 0;
+    T acc3 = 0;
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4)
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        if (want_prefetch)
+        {
+            __builtin_prefetch(ptr + (i + prefetch_dist) * stride, 0, 0);
+            __builtin_prefetch(ptr + (i + prefetch_dist + 1) * stride, 0, 0);
+            __builtin_prefetch(ptr + (i + prefetch_dist + 2) * stride, 0, 0);
+            __builtin_prefetch(ptr + (i + prefetch_dist + 3) * stride, 0, 0);
+        }
+#endif
+        acc0 += ptr[i * stride];
+        acc1 += ptr[(i + 1) * stride];
+        acc2 += ptr[(i + 2) * stride];
+        acc3 += ptr[(i + 3) * stride];
+    }
+    for (; i < n; ++i)
+    {
+        acc0 += ptr[i * stride];
+    }
+    return (acc0 + acc1) + (acc2 + acc3);
+}
+
+#if defined(MODMESH_SIMD_DISPATCH_X86)
+
+__attribute__((target("avx2"))) inline double sum_strided_block_avx2(double const * __restrict ptr, size_t n, size_t stride)
+{
+    const auto s = static_cast<long long>(stride);
+    const __m256i idx = _mm256_setr_epi64x(0, s, 2 * s, 3 * s);
+    __m256d acc0 = _mm256_setzero_pd();
+    __m256d acc1 = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8)
+    {
+        acc0 = _mm256_add_pd(acc0, _mm256_i64gather_pd(ptr + i * stride, idx, 8));
+        acc1 = _mm256_add_pd(acc1, _mm256_i64gather_pd(ptr + (i + 4) * stride, idx, 8));
+    }
+    acc0 = _mm256_add_pd(acc0, acc1);
+    // Shuffle-and-add tree instead of the slower HADDPD.
+    __m128d acc = _mm_add_pd(_mm256_castpd256_pd128(acc0), _mm256_extractf128_pd(acc0, 1));
+    double ret = _mm_cvtsd_f64(_mm_add_sd(acc, _mm_unpackhi_pd(acc, acc)));
+    for (; i < n; ++i)
+    {
+        ret += ptr[i * stride];
+    }
+    return ret;
+}
+
+__attribute__((target("avx512f"))) inline double sum_strided_block_avx512(double const * __restrict ptr, size_t n, size_t stride)
+{
+    const auto s = static_cast<long long>(stride);
+    const __m512i idx = _mm512_setr_epi64(0, s, 2 * s, 3 * s, 4 * s, 5 * s, 6 * s, 7 * s);
+    __m512d acc0 = _mm512_setzero_pd();
+    __m512d acc1 = _mm512_setzero_pd();
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16)
+    {
+        acc0 = _mm512_add_pd(acc0, _mm512_i64gather_pd(idx, ptr + i * stride, 8));
+        acc1 = _mm512_add_pd(acc1, _mm512_i64gather_pd(idx, ptr + (i + 8) * stride, 8));
+    }
+    double ret = _mm512_reduce_add_pd(_mm512_add_pd(acc0, acc1));
+    for (; i < n; ++i)
+    {
+        ret += ptr[i * stride];
+    }
+    return ret;
+}
+
+/**
+ * Small-stride double blocks go through VGATHERQPD, which packs four
+ * (AVX2) or eight (AVX-512) strided loads into one instruction; it pays
+ * off only while several elements share a cache line, so wide strides
+ * keep the prefetching scalar loop.  CPUID is consulted once per
+ * process like the contiguous dispatchers above.
+ */
+inline double sum_strided_block(double const * ptr, size_t n, size_t stride)
+{
+    using fn_type = double (*)(double const *, size_t, size_t);
+    static const fn_type gather_impl = []() -> fn_type
+    {
+        if (__builtin_cpu_supports("avx512f"))
+        {
+            return sum_strided_block_avx512;
+        }
+        if (__builtin_cpu_supports("avx2"))
+        {
+            return sum_strided_block_avx2;
+        }
+        return nullptr;
+    }();
+    if (nullptr != gather_impl && stride * sizeof(double) < 64)
+    {
+        return gather_impl(ptr, n, stride);
+    }
+    return sum_strided_block<double>(ptr, n, stride);
+}
+
+#endif /* MODMESH_SIMD_DISPATCH_X86 */
+
+/**
+ * Pairwise reduction of a single strided run.  The same cascaded halving
+ * as sum_pairwise(), with the straight-line block handled by
+ * sum_strided_block() above.
+ */
+template <typename T>
+T sum_strided_1d(T const * __restrict ptr, size_t n, size_t stride)
+{
+    constexpr size_t blocksize = 128;
+    if (n > blocksize)
+    {
+        const size_t half = n / 2;
+        return sum_strided_1d(ptr, half, stride) + sum_strided_1d(ptr + half * stride, n - half, stride);
+    }
+    return sum_strided_block(ptr, n, stride);
+}
+
+/**
+ * Sum an array following explicit shape and stride (in element count, not
+ * byte count).  The loop nest is ordered by stride with the smallest
+ * stride innermost, so the inner loop makes the most cache-line-friendly
+ * accesses a view's layout allows regardless of the axis order handed in.
+ * Each innermost run is reduced pairwise and the per-run sums are folded
+ * in with Kahan compensation, so the rounding error stays in the same
+ * envelope as the contiguous pairwise path instead of growing with the
+ * number of runs; the outer axes are walked with an odometer.
+ *
+ * When a single innermost run touches more memory than fits in L1 and
+ * outer axes remain, the run is cut into L1-sized tiles and the outer
+ * axes are walked once per tile.  Axes of an interleaved layout (outer
+ * stride smaller than the inner run footprint, possible through the
+ * explicit shape/stride constructor) then revisit a tile's cache lines
+ * while they are still resident instead of after eviction.
+ */
+/// Dimensionality ceiling for the stack-resident loop-nest metadata.
+constexpr size_t STRIDED_MAX_NDIM = 8;
+
+/**
+ * Loop-nest metadata copied out of the shape/stride vectors into plain
+ * stack arrays.  The vectors may live on the heap (past the small_vector
+ * inline capacity); the reduction loops would then reload the extents
+ * through a pointer every iteration.  The span is passed by value so the
+ * compiler sees the arrays as local and can keep them in registers.
+ */
+struct StridedSpan
+{
+    size_t shape[STRIDED_MAX_NDIM];
+    size_t stride[STRIDED_MAX_NDIM];
+    size_t ndim;
+};
+
+/**
+ * StaticDim pins the rank at compile time for the common low ranks so
+ * the offset loop and the odometer fully unroll; zero keeps the rank a
+ * runtime value for the general case.
+ */
+template <typename T, size_t StaticDim = 0>
+T sum_strided_span(T const * __restrict ptr, StridedSpan const span)
+{
+    const size_t ndim = (0 != StaticDim) ? StaticDim : span.ndim;
+    const size_t ilast = ndim - 1;
+    const size_t nlast = span.shape[ilast];
+    const size_t slast = span.stride[ilast];
+    // Tile the innermost axis to the L1 working-set size when outer axes
+    // exist to revisit it; a lone run gains nothing from tiling.
+    constexpr size_t l1_bytes = 32768;
+    size_t tile = nlast;
+    if (ndim >= 2 && nlast * slast * sizeof(T) > l1_bytes)
+    {
+        tile = l1_bytes / (slast * sizeof(T));
+        if (tile < 128)
+        {
+            tile = 128; // Keep the pairwise straight-line block filled.
+        }
+    }
+    T total = 0;
+    T comp = 0; // Kahan compensation across the per-run sums.
+    for (size_t start = 0; start < nlast; start += tile)
+    {
+        const size_t len = (tile < nlast - start) ? tile : nlast - start;
+        size_t idx[STRIDED_MAX_NDIM] = {0};
+        while (true)
+        {
+            size_t offset = start * slast;
+            for (size_t d = 0; d < ilast; ++d)
+            {
+                offset += idx[d] * span.stride[d];
+            }
+            const T run = sum_strided_1d(ptr + offset, len, slast);
+            if constexpr (std::is_floating_point_v<T>)
+            {
+                const T y = run - comp;
+                const T t = total + y;
+                comp = (t - total) - y;
+                total = t;
+            }
+            else
+            {
+                total += run;
+            }
+            // Advance the odometer over the outer axes.
+            size_t d = ilast;
+            bool done = false;
+            while (true)
+            {
+                if (0 == d)
+                {
+                    done = true;
+                    break;
+                }
+                --d;
+                if (++idx[d] < span.shape[d])
+                {
+                    break;
+                }
+                idx[d] = 0;
+            }
+            if (done)
+            {
+                break;
+            }
+        }
+    }
+    return total;
+}
+
+template <typename T>
+T sum_strided(T const * __restrict ptr, shape_type const & in_shape, shape_type const & in_stride)
+{
+    const size_t ndim = in_shape.size();
+    shape_type order(ndim, 0);
+    for (size_t d = 0; d < ndim; ++d)
+    {
+        order[d] = d;
+    }
+    std::sort(
+        order.begin(),
+        order.end(),
+        [&in_stride](size_t a, size_t b)
+        { return in_stride[a] > in_stride[b]; });
+    if (ndim > STRIDED_MAX_NDIM)
+    {
+        // Deeper arrays than the span holds are far from any hot path:
+        // peel the widest-stride axis and recurse until the rest fits.
+        shape_type sub_shape(ndim - 1, 0);
+        shape_type sub_stride(ndim - 1, 0);
+        for (size_t d = 1; d < ndim; ++d)
+        {
+            sub_shape[d - 1] = in_shape[order[d]];
+            sub_stride[d - 1] = in_stride[order[d]];
+        }
+        T total = 0;
+        T comp = 0;
+        for (size_t i = 0; i < in_shape[order[0]]; ++i)
+        {
+            const T run = sum_strided(ptr + i * in_stride[order[0]], sub_shape, sub_stride);
+            if constexpr (std::is_floating_point_v<T>)
+            {
+                const T y = run - comp;
+                const T t = total + y;
+                comp = (t - total) - y;
+                total = t;
+            }
+            else
+            {
+                total += run;
+            }
+        }
+        return total;
+    }
+    StridedSpan span;
+    span.ndim = ndim;
+    for (size_t d = 0; d < ndim; ++d)
+    {
+        span.shape[d] = in_shape[order[d]];
+        span.stride[d] = in_stride[order[d]];
+    }
+    // Every test and almost every mesh container is rank 1 to 3;
+    // dispatch those to instantiations with the rank pinned.
+    switch (ndim)
+    {
+    case 1:
+        // A single strided run needs no odometer at all.
+        return sum_strided_1d(ptr, span.shape[0], span.stride[0]);
+    case 2:
+        return sum_strided_span<T, 2>(ptr, span);
+    case 3:
+        return sum_strided_span<T, 3>(ptr, span);
+    default:
+        return sum_strided_span(ptr, span);
+    }
+}
+
+/// Element count above which a small-stride view is worth materializing
+/// into a contiguous scratch before reducing; below it the copy overhead
+/// dominates the reduction itself.
+constexpr size_t MATERIALIZE_SUM_MIN = 1 << 16;
+
+/**
+ * Pack a strided view into a contiguous destination, walking the source
+ * with the same stride-sorted order as sum_strided() so the gather
+ * stream is as sequential as the layout allows.  The write stream is
+ * purely sequential.
+ */
+template <typename T>
+void copy_strided(T * __restrict dst, T const * __restrict src, shape_type const & in_shape, shape_type const & in_stride)
+{
+    const size_t ndim = in_shape.size();
+    shape_type order(ndim, 0);
+    for (size_t d = 0; d < ndim; ++d)
+    {
+        order[d] = d;
+    }
+    std::sort(
+        order.begin(),
+        order.end(),
+        [&in_stride](size_t a, size_t b)
+        { return in_stride[a] > in_stride[b]; });
+    shape_type shape(ndim, 0);
+    shape_type stride(ndim, 0);
+    for (size_t d = 0; d < ndim; ++d)
+    {
+        shape[d] = in_shape[order[d]];
+        stride[d] = in_stride[order[d]];
+    }
+    const size_t ilast = ndim - 1;
+    const size_t nlast = shape[ilast];
+    const size_t slast = stride[ilast];
+    shape_type idx(ndim, 0);
+    while (true)
+    {
+        size_t offset = 0;
+        for (size_t d = 0; d < ilast; ++d)
+        {
+            offset += idx[d] * stride[d];
+        }
+        T const * p = src + offset;
+        for (size_t i = 0; i < nlast; ++i)
+        {
+            dst[i] = p[i * slast];
+        }
+        dst += nlast;
+        size_t d = ilast;
+        while (true)
+        {
+            if (0 == d)
+            {
+                return;
+            }
+            --d;
+            if (++idx[d] < shape[d])
+            {
+                break;
+            }
+            idx[d] = 0;
+        }
+    }
+}
+
 template <typename A, typename T>
 class SimpleArrayMixinCalculators
 {
@@ -124,6 +868,48 @@ private:
 
     using internal_types = detail::SimpleArrayInternalTypes<T>;
 
+    /// Hand every element selected by the shape and stride to the
+    /// visitor.  The flat scans below use it when the array is not
+    /// contiguous and walking the buffer extent would read elements the
+    /// view skips over.
+    template <typename V>
+    void visit_strided(V && visit) const
+    {
+        auto athis = static_cast<A const *>(this);
+        using shape_type = typename A::shape_type;
+        for (size_t d = 0; d < athis->ndim(); ++d)
+        {
+            if (0 == athis->shape(d))
+            {
+                return;
+            }
+        }
+        shape_type idx(athis->ndim(), 0);
+        while (true)
+        {
+            size_t offset = 0;
+            for (size_t d = 0; d < athis->ndim(); ++d)
+            {
+                offset += idx[d] * athis->stride(d);
+            }
+            visit(athis->data(offset));
+            size_t d = athis->ndim();
+            while (true)
+            {
+                if (0 == d)
+                {
+                    return;
+                }
+                --d;
+                if (++idx[d] < athis->shape(d))
+                {
+                    break;
+                }
+                idx[d] = 0;
+            }
+        }
+    }
+
 public:
 
     using value_type = typename internal_types::value_type;
@@ -132,6 +918,18 @@ public:
     {
         value_type initial = std::numeric_limits<value_type>::max();
         auto athis = static_cast<A const *>(this);
+        if (!athis->is_c_contiguous())
+        {
+            visit_strided(
+                [&initial](value_type const & v)
+                {
+                    if (v < initial)
+                    {
+                        initial = v;
+                    }
+                });
+            return initial;
+        }
         for (size_t i = 0; i < athis->size(); ++i)
         {
             if (athis->data(i) < initial)
@@ -146,6 +944,18 @@ public:
     {
         value_type initial = std::numeric_limits<value_type>::lowest();
         auto athis = static_cast<A const *>(this);
+        if (!athis->is_c_contiguous())
+        {
+            visit_strided(
+                [&initial](value_type const & v)
+                {
+                    if (v > initial)
+                    {
+                        initial = v;
+                    }
+                });
+            return initial;
+        }
         for (size_t i = 0; i < athis->size(); ++i)
         {
             if (athis->data(i) > initial)
@@ -162,6 +972,10 @@ public:
         auto athis = static_cast<A const *>(this);
         if constexpr (!std::is_same_v<bool, std::remove_const_t<value_type>>)
         {
+            if (!athis->is_c_contiguous())
+            {
+                return detail::sum_strided(athis->data(), athis->shape(), athis->stride());
+            }
             for (size_t i = 0; i < athis->size(); ++i)
             {
                 initial += athis->data(i);
@@ -169,6 +983,13 @@ public:
         }
         else
         {
+            if (!athis->is_c_contiguous())
+            {
+                visit_strided(
+                    [&initial](value_type const & v)
+                    { initial |= v; });
+                return initial;
+            }
             for (size_t i = 0; i < athis->size(); ++i)
             {
                 initial |= athis->data(i);
@@ -177,6 +998,204 @@ public:
         return initial;
     }
 
+    value_type mean() const
+    {
+        auto athis = static_cast<A const *>(this);
+        // The element count follows the shape, not the buffer, so that
+        // non-contiguous views are averaged over the viewed elements only.
+        size_t n = athis->ndim() > 0 ? 1 : athis->size();
+        for (size_t d = 0; d < athis->ndim(); ++d)
+        {
+            n *= athis->shape(d);
+        }
+        if (0 == n)
+        {
+            return value_type();
+        }
+        if constexpr (!std::is_same_v<bool, std::remove_const_t<value_type>>)
+        {
+            value_type total;
+            if (athis->is_c_contiguous())
+            {
+                if (n <= detail::SMALL_SUM_MAX)
+                {
+                    total = detail::sum_small(athis->data(), n);
+                }
+#ifdef _OPENMP
+                else if (n >= detail::OMP_SUM_THRESHOLD)
+                {
+                    total = detail::sum_parallel(athis->data(), n);
+                }
+#endif
+                else
+                {
+                    total = detail::sum_pairwise(athis->data(), n);
+                }
+            }
+            else
+            {
+                // A large view whose tightest axis still shares cache
+                // lines (element stride 2-7 for double) is packed into a
+                // contiguous scratch first: the copy streams through the
+                // same lines the strided kernel would touch, and the
+                // reduction then runs on the full-width contiguous path.
+                size_t smin = std::numeric_limits<size_t>::max();
+                for (size_t d = 0; d < athis->ndim(); ++d)
+                {
+                    smin = std::min(smin, athis->stride(d));
+                }
+                if (n >= detail::MATERIALIZE_SUM_MIN && smin > 1 && smin * sizeof(value_type) < 64)
+                {
+                    std::unique_ptr<value_type[]> const scratch(new value_type[n]);
+                    detail::copy_strided(scratch.get(), athis->data(), athis->shape(), athis->stride());
+#ifdef _OPENMP
+                    if (n >= detail::OMP_SUM_THRESHOLD)
+                    {
+                        total = detail::sum_parallel(scratch.get(), n);
+                    }
+                    else
+#endif
+                    {
+                        total = detail::sum_pairwise(scratch.get(), n);
+                    }
+                }
+                else
+                {
+                    total = detail::sum_strided(athis->data(), athis->shape(), athis->stride());
+                }
+            }
+            if constexpr (std::is_floating_point_v<value_type>)
+            {
+                // A reciprocal multiply is cheaper than a divide; the extra
+                // rounding is at most one ulp on an already-rounded sum.
+                const value_type inv_n = value_type(1) / static_cast<value_type>(n);
+                return total * inv_n;
+            }
+            else
+            {
+                return total / static_cast<value_type>(n);
+            }
+        }
+        else
+        {
+            return athis->sum();
+        }
+    }
+
+    /// Benchmarking helper: run mean() k times and return the last result.
+    /// Batching the repetition on the C++ side keeps the Python interpreter
+    /// loop out of microbenchmark timings.
+    value_type mean_repeat(size_t k) const
+    {
+        value_type result = value_type();
+        for (size_t i = 0; i < k; ++i)
+        {
+            result = mean();
+#if defined(__GNUC__) || defined(__clang__)
+            // Keep the optimizer from hoisting the loop-invariant call.
+            asm volatile("" ::: "memory");
+#endif
+        }
+        return result;
+    }
+
+    /// Average along one axis and return an array with that axis removed.
+    /// The non-reduced axes are walked row-major so the input streams
+    /// through cache in memory order, and the reduction runs with four
+    /// independent accumulators to expose instruction-level parallelism.
+    A mean_axis(size_t axis) const
+    {
+        auto athis = static_cast<A const *>(this);
+        if (axis >= athis->ndim())
+        {
+            throw std::out_of_range(
+                Formatter() << "SimpleArray: mean_axis axis " << axis << " is out of bounds with ndim " << athis->ndim());
+        }
+        using shape_type = typename A::shape_type;
+        shape_type oshape;
+        for (size_t d = 0; d < athis->ndim(); ++d)
+        {
+            if (d != axis)
+            {
+                oshape.push_back(athis->shape(d));
+            }
+        }
+        if (oshape.empty())
+        {
+            oshape.push_back(1);
+        }
+        A ret(oshape);
+        if constexpr (std::is_same_v<bool, std::remove_const_t<value_type>>)
+        {
+            throw std::runtime_error("SimpleArray: mean_axis does not support bool");
+        }
+        else
+        {
+            const size_t nred = athis->shape(axis);
+            const size_t rstride = athis->stride(axis);
+            size_t nout = 1;
+            for (size_t d = 0; d < oshape.size(); ++d)
+            {
+                nout *= oshape[d];
+            }
+            if (0 == nred)
+            {
+                std::fill(ret.begin(), ret.end(), value_type());
+                return ret;
+            }
+            shape_type oidx(athis->ndim(), 0);
+            for (size_t o = 0; o < nout; ++o)
+            {
+                size_t base = 0;
+                for (size_t d = 0; d < athis->ndim(); ++d)
+                {
+                    base += oidx[d] * athis->stride(d);
+                }
+                value_type const * p = athis->data() + base;
+                value_type acc0 = 0;
+                value_type acc1 = 0;
+                value_type acc2 = 0;
+                value_type acc3 = 0;
+                size_t i = 0;
+                for (; i + 4 <= nred; i += 4)
+                {
+                    acc0 += p[i * rstride];
+                    acc1 += p[(i + 1) * rstride];
+                    acc2 += p[(i + 2) * rstride];
+                    acc3 += p[(i + 3) * rstride];
+                }
+                for (; i < nred; ++i)
+                {
+                    acc0 += p[i * rstride];
+                }
+                const value_type total = (acc0 + acc1) + (acc2 + acc3);
+                if constexpr (std::is_floating_point_v<value_type>)
+                {
+                    ret.data(o) = total / static_cast<value_type>(nred);
+                }
+                else
+                {
+                    ret.data(o) = static_cast<value_type>(total / static_cast<value_type>(nred));
+                }
+                // Advance the odometer over the non-reduced axes, last
+                // axis fastest, matching the row-major output layout.
+                for (size_t d = athis->ndim(); d-- > 0;)
+                {
+                    if (d == axis)
+                    {
+                        continue;
+                    }
+                    if (++oidx[d] < athis->shape(d))
+                    {
+                        break;
+                    }
+                    oidx[d] = 0;
+                }
+            }
+        }
+        return ret;
+    }
+
     A abs() const
     {
         auto athis = static_cast<A const *>(this);
@@ -307,6 +1326,40 @@ public:
         }
     }
 
+    // NOLINTNEXTLINE(modernize-pass-by-value)
+    explicit SimpleArray(small_vector<size_t> const & shape, small_vector<size_t> const & stride, std::shared_ptr<buffer_type> const & buffer)
+        : SimpleArray(buffer)
+    {
+        if (buffer)
+        {
+            if (shape.size() != stride.size())
+            {
+                throw std::runtime_error(Formatter() << "SimpleArray: shape size " << shape.size()
+                                                     << " differs from stride size " << stride.size());
+            }
+            // The buffer must cover the last element addressed through the
+            // shape/stride pair; a non-contiguous view may span more bytes
+            // than it has elements.
+            size_t nbytes = shape.empty() ? 0 : ITEMSIZE;
+            for (size_t it = 0; it < shape.size(); ++it)
+            {
+                if (0 == shape[it])
+                {
+                    nbytes = 0;
+                    break;
+                }
+                nbytes += (shape[it] - 1) * stride[it] * ITEMSIZE;
+            }
+            if (nbytes > buffer->nbytes())
+            {
+                throw std::runtime_error(Formatter() << "SimpleArray: shape/stride byte extent " << nbytes
+                                                     << " exceeds buffer " << buffer->nbytes());
+            }
+            m_shape = shape;
+            m_stride = stride;
+        }
+    }
+
     SimpleArray(std::initializer_list<T> init)
         : SimpleArray(init.size())
     {
@@ -420,23 +1473,39 @@ public:
 
     value_type const & at(size_t it) const
     {
+        if (!is_c_contiguous())
+        {
+            return data(buffer_offset_from_linear(it));
+        }
         validate_range(it);
         return data(it);
     }
     value_type & at(size_t it)
     {
+        if (!is_c_contiguous())
+        {
+            return data(buffer_offset_from_linear(it));
+        }
         validate_range(it);
         return data(it);
     }
 
     value_type const & at(ssize_t it) const
     {
+        if (!is_c_contiguous())
+        {
+            return data(buffer_offset_from_linear(static_cast<size_t>(it + static_cast<ssize_t>(m_nghost))));
+        }
         validate_range(it);
         it += m_nghost;
         return data(it);
     }
     value_type & at(ssize_t it)
     {
+        if (!is_c_contiguous())
+        {
+            return data(buffer_offset_from_linear(static_cast<size_t>(it + static_cast<ssize_t>(m_nghost))));
+        }
         validate_range(it);
         it += m_nghost;
         return data(it);
@@ -486,6 +1555,10 @@ public:
     size_t stride(size_t it) const noexcept { return m_stride[it]; }
     size_t & stride(size_t it) noexcept { return m_stride[it]; }
 
+    /// True when the strides describe a dense row-major (C order) layout,
+    /// i.e. the elements can be walked with a single unit-stride loop.
+    bool is_c_contiguous() const { return m_stride == calc_stride(m_shape); }
+
     size_t nghost() const { return m_nghost; }
     size_t nbody() const { return m_shape.empty() ? 0 : m_shape[0] - m_nghost; }
     bool has_ghost() const { return m_nghost != 0; }
@@ -527,6 +1600,29 @@ public:
         return SimpleArray(m_shape, m_buffer);
     }
 
+    /// Return a view taking every step-th element along the first axis.
+    /// The view shares the buffer with this array; no data is copied.
+    /// The shape-aware members (the calculators, fill, at-based element
+    /// access, and ndarray export) see only the selected elements;
+    /// size(), nbytes(), the raw operator[], and the iterators keep
+    /// addressing the shared underlying buffer.
+    SimpleArray stride_view(size_t step) const
+    {
+        if (0 == step)
+        {
+            throw std::out_of_range("SimpleArray: stride_view step cannot be 0");
+        }
+        if (0 == ndim())
+        {
+            throw std::out_of_range("SimpleArray: cannot take stride_view of an empty array");
+        }
+        shape_type shape = m_shape;
+        shape_type stride = m_stride;
+        shape[0] = (m_shape[0] + step - 1) / step;
+        stride[0] = m_stride[0] * step;
+        return SimpleArray(shape, stride, m_buffer);
+    }
+
     void swap(SimpleArray & other) noexcept
     {
         if (this != &other)
@@ -563,6 +1659,31 @@ public:
 
 private:
 
+    /// Map a logical row-major element index onto the buffer through the
+    /// stride vector.  Only used when the array is not contiguous, where
+    /// the logical index and the buffer offset diverge; bounds follow the
+    /// shape, not the buffer extent.
+    size_t buffer_offset_from_linear(size_t it) const
+    {
+        size_t nelem = 1;
+        for (size_t d = 0; d < ndim(); ++d)
+        {
+            nelem *= m_shape[d];
+        }
+        if (it >= nelem)
+        {
+            throw std::out_of_range(
+                Formatter() << "SimpleArray: index " << it << " >= number of elements " << nelem);
+        }
+        shape_type idx(ndim(), 0);
+        for (size_t d = ndim(); d > 0; --d)
+        {
+            idx[d - 1] = it % m_shape[d - 1];
+            it /= m_shape[d - 1];
+        }
+        return buffer_offset(m_stride, idx);
+    }
+
     void validate_range(ssize_t it) const
     {
         if (m_nghost != 0 && ndim() != 1)
@@ -36,6 +36,93 @@ namespace modmesh
 namespace python
 {
 
+/// Build a SimpleArray<T> from the input ndarray.  C-contiguous input is
+/// aliased without copying; everything else is copied into a contiguous
+/// ndarray first, because the flat accessors of SimpleArray (sum, min,
+/// max, fill, linear indexing, iterators) walk the whole buffer and
+/// would read and write elements outside a non-contiguous view.  Callers
+/// that only run the stride-aware reductions may pass alias_noncontiguous
+/// to alias any layout with positive, element-aligned strides.
+template <typename T>
+// NOLINTNEXTLINE(misc-use-anonymous-namespace)
+static SimpleArray<T> make_array_from_ndarray(pybind11::array & arr_in, bool const alias_noncontiguous = false)
+{
+    namespace py = pybind11;
+
+    if (!dtype_is_type<T>(arr_in))
+    {
+        throw std::runtime_error("dtype mismatch");
+    }
+
+    constexpr ssize_t itemsize = static_cast<ssize_t>(sizeof(T));
+    bool aliasable = alias_noncontiguous || 0 != (arr_in.flags() & py::array::c_style);
+    for (ssize_t i = 0; aliasable && i < arr_in.ndim(); ++i)
+    {
+        const ssize_t st = arr_in.strides(i);
+        if (st < 0 || 0 != st % itemsize)
+        {
+            aliasable = false;
+        }
+    }
+    if (!aliasable)
+    {
+        py::array arr_copy(py::array_t<T, py::array::c_style | py::array::forcecast>::ensure(arr_in));
+        return make_array_from_ndarray<T>(arr_copy);
+    }
+
+    modmesh::detail::shape_type shape;
+    modmesh::detail::shape_type stride;
+    size_t nelem = 1;
+    size_t nbytes = arr_in.ndim() > 0 ? sizeof(T) : arr_in.nbytes();
+    for (ssize_t i = 0; i < arr_in.ndim(); ++i)
+    {
+        const size_t shape_i = arr_in.shape(i);
+        const size_t stride_i = arr_in.strides(i) / itemsize;
+        shape.push_back(shape_i);
+        stride.push_back(stride_i);
+        nelem *= shape_i;
+        nbytes += (shape_i > 0 ? shape_i - 1 : 0) * stride_i * sizeof(T);
+    }
+    if (0 == nelem)
+    {
+        nbytes = 0;
+    }
+    std::shared_ptr<ConcreteBuffer> const buffer = ConcreteBuffer::construct(
+        nbytes,
+        arr_in.mutable_data(),
+        std::make_unique<ConcreteBufferNdarrayRemover>(arr_in));
+    return SimpleArray<T>(shape, stride, buffer);
+}
+
+/// Reduce an ndarray view to its mean in one call.  mean() only touches
+/// the view through the stride-aware kernels, so non-contiguous input is
+/// aliased instead of copied; the call-scoped C++ SimpleArray never
+/// reaches the flat accessors and no Python-side wrapper is allocated.
+// NOLINTNEXTLINE(misc-use-anonymous-namespace)
+static pybind11::object mean_of_view(pybind11::array & arr_in)
+{
+    namespace py = pybind11;
+
+// NOLINTNEXTLINE(cppcoreguidelines-macro-usage)
+#define MM_DECL_MEAN_OF_VIEW(T) \
+    if (dtype_is_type<T>(arr_in)) \
+    { \
+        return py::cast(make_array_from_ndarray<T>(arr_in, true).mean()); \
+    }
+    MM_DECL_MEAN_OF_VIEW(int8_t)
+    MM_DECL_MEAN_OF_VIEW(int16_t)
+    MM_DECL_MEAN_OF_VIEW(int32_t)
+    MM_DECL_MEAN_OF_VIEW(int64_t)
+    MM_DECL_MEAN_OF_VIEW(uint8_t)
+    MM_DECL_MEAN_OF_VIEW(uint16_t)
+    MM_DECL_MEAN_OF_VIEW(uint32_t)
+    MM_DECL_MEAN_OF_VIEW(uint64_t)
+    MM_DECL_MEAN_OF_VIEW(float)
+    MM_DECL_MEAN_OF_VIEW(double)
+#undef MM_DECL_MEAN_OF_VIEW
+    throw std::runtime_error("mean_of_view: unsupported dtype");
+}
+
 template <typename T>
 class MODMESH_PYTHON_WRAPPER_VISIBILITY WrapSimpleArray
     : public WrapBase<WrapSimpleArray<T>, SimpleArray<T>>
@@ -69,23 +156,17 @@ class MODMESH_PYTHON_WRAPPER_VISIBILITY WrapSimpleArray
             .def(
                 py::init(
                     [](py::array & arr_in)
-                    {
-                        if (!dtype_is_type<T>(arr_in))
-                        {
-                            throw std::runtime_error("dtype mismatch");
-                        }
-                        modmesh::detail::shape_type shape;
-                        for (ssize_t i = 0; i < arr_in.ndim(); ++i)
-                        {
-                            shape.push_back(arr_in.shape(i));
-                        }
-                        std::shared_ptr<ConcreteBuffer> const buffer = ConcreteBuffer::construct(
-                            arr_in.nbytes(),
-                            arr_in.mutable_data(),
-                            std::make_unique<ConcreteBufferNdarrayRemover>(arr_in));
-                        return wrapped_type(shape, buffer);
-                    }),
+                    { return make_array_from_ndarray<T>(arr_in); }),
                 py::arg("array"))
+            // Single-signature alternative to the keyword constructor.
+            // __init__ walks the overload chain (two shape signatures
+            // fail first) and parses keywords on every call; this goes
+            // straight to the ndarray path, which matters when wrapping
+            // is in a hot loop.
+            .def_static(
+                "from_ndarray",
+                [](py::array & arr_in)
+                { return make_array_from_ndarray<T>(arr_in); })
             .def_buffer(&property_helper::get_buffer_info)
             .def_property_readonly(
                 "ndarray",
@@ -136,6 +217,12 @@ class MODMESH_PYTHON_WRAPPER_VISIBILITY WrapSimpleArray
                 "reshape",
                 [](wrapped_type const & self, py::object const & shape)
                 { return self.reshape(make_shape(shape)); })
+            // The returned view holds the buffer through a shared_ptr, so no
+            // keep_alive on the parent wrapper is needed.  Calculators,
+            // fill, and indexing follow the view's shape and stride;
+            // size/__len__ keep reporting the shared buffer extent.
+            .def("stride_view", &wrapped_type::stride_view, py::arg("step"))
+            .def_property_readonly("is_c_contiguous", &wrapped_type::is_c_contiguous)
             .def_property_readonly("has_ghost", &wrapped_type::has_ghost)
             .def_property("nghost", &wrapped_type::nghost, &wrapped_type::set_nghost)
             .def_property_readonly("nbody", &wrapped_type::nbody)
@@ -173,6 +260,15 @@ class MODMESH_PYTHON_WRAPPER_VISIBILITY WrapSimpleArray
             .def("min", &wrapped_type::min)
             .def("max", &wrapped_type::max)
             .def("sum", &wrapped_type::sum)
+            // mean() works on the raw buffer and returns a plain scalar, so
+            // it can drop the GIL for the duration of the reduction.  The
+            // binding deliberately avoids def_timed(): for tiny arrays the
+            // wrapper-profiler bookkeeping would cost more than the kernel.
+            .def("mean", &wrapped_type::mean, py::call_guard<py::gil_scoped_release>())
+            // Benchmarking helper: batches the repetition on the C++ side so
+            // the profiling scripts do not measure the Python loop bytecode.
+            .def("mean_repeat", &wrapped_type::mean_repeat, py::arg("k"), py::call_guard<py::gil_scoped_release>())
+            .def("mean_axis", &wrapped_type::mean_axis, py::arg("axis"), py::call_guard<py::gil_scoped_release>())
             .def("abs", &wrapped_type::abs)
             //
             ;
@@ -241,6 +337,8 @@ void wrap_SimpleArray(pybind11::module & mod)
     WrapSimpleArray<float>::commit(mod, "SimpleArrayFloat32", "SimpleArrayFloat32");
     WrapSimpleArray<double>::commit(mod, "SimpleArrayFloat64", "SimpleArrayFloat64");
 
+    mod.def("mean_of_view", &mean_of_view, pybind11::arg("array"));
+
     WrapSimpleCollector<bool>::commit(mod, "SimpleCollectorBool", "SimpleCollectorBool");
     WrapSimpleCollector<int8_t>::commit(mod, "SimpleCollectorInt8", "SimpleCollectorInt8");
     WrapSimpleCollector<int16_t>::commit(mod, "SimpleCollectorInt16", "SimpleCollectorInt16");
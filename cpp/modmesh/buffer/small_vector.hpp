@@ -143,7 +143,10 @@ public:
             {
                 if (m_capacity < other.m_size)
                 {
-                    delete[] m_head;
+                    if (m_head != m_data.data())
+                    {
+                        delete[] m_head;
+                    }
                     m_head = nullptr;
                 }
                 if (m_head == m_data.data() || m_head == nullptr)
@@ -176,6 +179,10 @@ public:
             }
             else
             {
+                if (m_head != m_data.data())
+                {
+                    delete[] m_head;
+                }
                 m_size = other.m_size;
                 m_capacity = other.m_capacity;
                 m_head = other.m_head;
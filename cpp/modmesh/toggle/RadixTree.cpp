@@ -44,6 +44,7 @@ void CallProfiler::reset()
     }
     m_radix_tree.reset();
     m_cancel_callbacks.clear();
+    ++m_generation;
 }
 
 // NOLINTNEXTLINE(misc-no-recursion)
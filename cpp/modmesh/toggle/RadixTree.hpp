@@ -258,6 +258,7 @@ public:
         CallerProfile & callProfile = m_radix_tree.get_current_node()->data();
         callProfile.caller_name = caller_name;
         callProfile.start_stopwatch();
+        ++m_generation;
     }
 
     // Called when a function ends
@@ -266,8 +267,14 @@ public:
         CallerProfile & call_profile = m_radix_tree.get_current_node()->data();
         call_profile.stop_stopwatch(); // Update profiling information
         m_radix_tree.move_current_to_parent(); // Pop the caller from the call stack
+        ++m_generation;
     }
 
+    /// Monotonic counter bumped whenever the tree (or the current node)
+    /// changes.  Consumers may cache a serialized view of the profiling
+    /// result and reuse it as long as the generation stays the same.
+    uint64_t generation() const { return m_generation; }
+
     /// Print the profiling information
     void print_profiling_result(std::ostream & outstream) const
     {
@@ -295,6 +302,7 @@ private:
 private:
     RadixTree<CallerProfile> m_radix_tree; /// the data structure of the callers
     std::vector<std::function<void()>> m_cancel_callbacks; /// the callback to cancel the profiling from all probes
+    uint64_t m_generation = 0; /// bumped on every tree mutation; see generation()
 
     friend detail::CallProfilerTest;
 }; /* end class CallProfiler */
@@ -165,6 +165,34 @@ protected:
 
 }; /* end class WrapTimeRegistry */
 
+/// Copy a result() tree so callers may mutate their dict freely.  Only
+/// the containers (the per-node dict and its children list) are copied;
+/// the leaf values are immutable Python scalars and can be shared.
+// NOLINTNEXTLINE(misc-no-recursion,misc-use-anonymous-namespace)
+static pybind11::dict copy_result_tree(pybind11::dict const & src)
+{
+    namespace py = pybind11;
+
+    py::dict dst;
+    for (auto const & item : src)
+    {
+        if (py::isinstance<py::list>(item.second))
+        {
+            py::list children;
+            for (auto const & child : py::cast<py::list>(item.second))
+            {
+                children.append(copy_result_tree(py::cast<py::dict>(child)));
+            }
+            dst[item.first] = children;
+        }
+        else
+        {
+            dst[item.first] = item.second;
+        }
+    }
+    return dst;
+}
+
 class MODMESH_PYTHON_WRAPPER_VISIBILITY WrapCallProfiler : public WrapBase<WrapCallProfiler, CallProfiler>
 {
 public:
@@ -183,6 +211,17 @@ protected:
                 { return wrapped_type::instance(); })
             .def("result", [](CallProfiler & profiler)
                  {
+            // Rebuilding the dict tree dominates result() for small
+            // profiles, so the last-built tree is cached and reused until
+            // the profiler mutates.  Callers receive a copy of the cached
+            // tree so mutating the returned dict cannot corrupt later
+            // calls.  The cache holds a raw handle (not a py::object) to
+            // avoid destructor ordering trouble at interpreter shutdown.
+            static uint64_t cached_generation = 0;
+            static py::handle cached_result;
+            if (cached_result && cached_generation == profiler.generation()) {
+                return copy_result_tree(py::reinterpret_borrow<py::dict>(cached_result));
+            }
             const RadixTreeNode<CallerProfile> * root = profiler.radix_tree().get_root();
             if (root->empty_children()) {
                 return py::dict();
@@ -215,7 +254,13 @@ protected:
                 }
                 current_dict["children"] = children_list;
             }
-            return result; })
+            if (cached_result) {
+                cached_result.dec_ref();
+            }
+            cached_result = result;
+            cached_result.inc_ref();
+            cached_generation = profiler.generation();
+            return copy_result_tree(result); })
             .def("reset", &wrapped_type::reset);
         ;
 
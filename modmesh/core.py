@@ -63,6 +63,7 @@ __all__ = [  # noqa: F822
     'SimpleArrayUint64',
     'SimpleArrayFloat32',
     'SimpleArrayFloat64',
+    'mean_of_view',
     'SimpleCollectorBool',
     'SimpleCollectorInt8',
     'SimpleCollectorInt16',
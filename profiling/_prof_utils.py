@@ -0,0 +1,92 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Shared helpers for the profiling scripts.
+"""
+
+import statistics
+import sys
+import time
+
+NUM_REPEATS = 7
+
+
+def autoscale(fn, target_s=0.1):
+    """Return an iteration count k such that k calls of fn() take at
+    least target_s seconds.
+
+    Hard-coded iteration counts give too few samples on fast
+    configurations and waste seconds on slow ones; doubling k until the
+    burst crosses the target bounds both.
+    """
+    k = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(k):
+            fn()
+        if time.perf_counter_ns() - start >= target_s * 1e9:
+            return k
+        k *= 2
+
+
+def time_burst(fn):
+    """Median wall time of NUM_REPEATS bursts of fn(), in seconds.
+
+    fn() is called once beforehand to warm caches and amortize first-call
+    effects; perf_counter_ns is monotonic and has much finer resolution
+    than time.time().
+    """
+    fn()
+    durations = []
+    for _ in range(NUM_REPEATS):
+        start = time.perf_counter_ns()
+        fn()
+        durations.append(time.perf_counter_ns() - start)
+    return statistics.median(durations) / 1e9
+
+
+def print_tree(root):
+    """Print a call-profiler result dict as an indented tree.
+
+    The traversal is iterative with an explicit stack so that printing
+    deep trees does not add per-node Python function-call overhead on
+    top of what is being profiled.
+    """
+    lines = []
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if "name" in node:
+            lines.append("{}{} - {:.6f} ms, count {}\n".format(
+                "  " * depth, node["name"], node["total_time"],
+                node["count"]))
+        # Reversed so that the children print in their stored order.
+        for child in reversed(node.get("children", ())):
+            stack.append((child, depth + 1))
+    sys.stdout.write("".join(lines))
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
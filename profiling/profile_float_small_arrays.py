@@ -0,0 +1,131 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare SimpleArray.mean() against the NumPy baseline on small float
+arrays, where per-call overhead rather than memory bandwidth dominates.
+"""
+
+
+import numpy as np
+
+import modmesh
+
+from _prof_utils import autoscale
+from _prof_utils import time_burst
+
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+# Generate the random pool once at import; per-config np.random.rand
+# calls would add RNG time and first-touch page faults near the timed
+# region.  Each config takes a contiguous prefix view of the pool.
+MAX_SIZE = 10000
+_BIG64 = np.random.rand(MAX_SIZE)
+_BIG32 = _BIG64.astype('float32')
+
+if nb is not None:
+    @nb.njit(parallel=True, fastmath=True)
+    def numba_mean(a):
+        s = 0.0
+        for i in nb.prange(a.shape[0]):
+            s += a[i]
+        return s / a.shape[0]
+
+
+def profile_single_test(size, dtype):
+    if dtype == 'float32':
+        nparr = _BIG32[:size]
+        sarr = modmesh.SimpleArrayFloat32(array=nparr)
+    else:
+        nparr = _BIG64[:size]
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+
+    # Each baseline gets its own autoscaled iteration count so every
+    # burst runs long enough for a stable reading without wasting time
+    # on the slower baselines.
+    np_iters = autoscale(nparr.mean)
+
+    def np_burst():
+        for _ in range(np_iters):
+            nparr.mean()
+
+    np_time = time_burst(np_burst) / np_iters
+
+    # Batch the repetition in C++ so the Python loop bytecode does not
+    # dominate the measurement for small arrays.
+    sarr_iters = autoscale(sarr.mean)
+    sarr_time = time_burst(
+        lambda: sarr.mean_repeat(sarr_iters)) / sarr_iters
+
+    # A parallel fastmath numba kernel approximates the throughput
+    # ceiling of the hardware; the autoscale warm-up also absorbs the
+    # JIT compilation.
+    nb_time = None
+    if nb is not None:
+        nb_iters = autoscale(lambda: numba_mean(nparr))
+
+        def nb_burst():
+            for _ in range(nb_iters):
+                numba_mean(nparr)
+
+        nb_time = time_burst(nb_burst) / nb_iters
+
+    return np_time, sarr_time, nb_time
+
+
+def main():
+    test_configs = [
+        ("Very small", 10),
+        ("Small", 100),
+        ("Medium", 1000),
+        ("Large", 10000),
+    ]
+
+    for dtype in ('float32', 'float64'):
+        print("dtype: {}".format(dtype))
+        print("{:<12} {:>8} {:>12} {:>12} {:>12} {:>8} {:>8}".format(
+            "config", "size", "np (us)", "sarr (us)", "nb (us)",
+            "np/sa", "nb/sa"))
+        for name, size in test_configs:
+            np_time, sarr_time, nb_time = profile_single_test(size, dtype)
+            nb_us = "-" if nb_time is None else "{:.3f}".format(
+                nb_time * 1e6)
+            nb_ratio = "-" if nb_time is None else "{:.2f}".format(
+                nb_time / sarr_time)
+            print("{:<12} {:>8} {:>12.3f} {:>12.3f} {:>12} {:>8.2f} "
+                  "{:>8}".format(
+                      name, size, np_time * 1e6, sarr_time * 1e6, nb_us,
+                      np_time / sarr_time, nb_ratio))
+        print()
+
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
@@ -0,0 +1,82 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare SimpleArray.mean() against the NumPy baseline on large float64
+arrays, where the reduction is bound by memory bandwidth.
+"""
+
+
+import numpy as np
+
+import modmesh
+
+from _prof_utils import autoscale
+from _prof_utils import time_burst
+
+# Generate the random pool once at import and slice a prefix per size;
+# regenerating 10M floats per configuration would dominate the script's
+# wall time.
+MAX_SIZE = 10000000
+_BIG64 = np.random.rand(MAX_SIZE)
+
+
+def profile_single_size(size):
+    nparr = _BIG64[:size]
+    sarr = modmesh.SimpleArrayFloat64(array=nparr)
+
+    np_iters = autoscale(nparr.mean)
+
+    def np_burst():
+        for _ in range(np_iters):
+            nparr.mean()
+
+    np_time = time_burst(np_burst) / np_iters
+
+    sarr_iters = autoscale(sarr.mean)
+    sarr_time = time_burst(
+        lambda: sarr.mean_repeat(sarr_iters)) / sarr_iters
+
+    return np_time, sarr_time
+
+
+def main():
+    sizes = [1000000, 2000000, 5000000, 10000000]
+
+    print("{:>10} {:>12} {:>12} {:>8} {:>12}".format(
+        "size", "np (ms)", "sarr (ms)", "ratio", "GB/s (sarr)"))
+    for size in sizes:
+        np_time, sarr_time = profile_single_size(size)
+        bandwidth = size * 8 / sarr_time / 1e9
+        print("{:>10} {:>12.3f} {:>12.3f} {:>8.2f} {:>12.2f}".format(
+            size, np_time * 1e3, sarr_time * 1e3, np_time / sarr_time,
+            bandwidth))
+
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
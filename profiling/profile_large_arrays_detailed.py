@@ -0,0 +1,106 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measure how the stride of a non-contiguous view affects the mean()
+reduction on a large float64 array.  The effective bandwidth drops as
+the stride grows and each cache line carries fewer useful elements.
+"""
+
+
+import numpy as np
+
+import modmesh
+
+from _perfcounters import PerfCounters
+from _prof_utils import autoscale
+from _prof_utils import time_burst
+
+
+def profile_single_stride(sarr_base, nparr, stride):
+    npview = nparr[::stride]
+    # Derive a zero-copy view from the already-wrapped base array instead
+    # of wrapping a fresh numpy view for every stride.
+    sarr = sarr_base.stride_view(stride)
+
+    np_iters = autoscale(npview.mean)
+
+    def np_burst():
+        for _ in range(np_iters):
+            npview.mean()
+
+    np_time = time_burst(np_burst) / np_iters
+
+    sarr_iters = autoscale(sarr.mean)
+    sarr_time = time_burst(
+        lambda: sarr.mean_repeat(sarr_iters)) / sarr_iters
+
+    # Hardware counters separate the compute-bound small-stride regime
+    # from the DRAM-bound large-stride regime; the dict is None when
+    # perf_event_open is unavailable.
+    counters = PerfCounters()
+    counters.start()
+    sarr.mean_repeat(sarr_iters)
+    counts = counters.stop()
+    counters.close()
+    if counts is not None:
+        nops = len(npview) * sarr_iters
+        counts = {name: value / nops for name, value in counts.items()}
+
+    return np_time, sarr_time, len(npview), counts
+
+
+def main():
+    size = 10000000
+    strides = [1, 2, 3, 5, 7, 11, 17, 23, 31, 47]
+    nparr = np.random.rand(size)
+    sarr_base = modmesh.SimpleArrayFloat64(array=nparr)
+
+    print("Memory Bandwidth Analysis ({} float64 elements)".format(size))
+    print("{:>8} {:>10} {:>12} {:>12} {:>8} {:>12} {:>10} {:>10}".format(
+        "stride", "elements", "np (ms)", "sarr (ms)", "ratio",
+        "GB/s (sarr)", "cyc/elem", "miss/elem"))
+    for stride in strides:
+        np_time, sarr_time, nelem, counts = profile_single_stride(
+            sarr_base, nparr, stride)
+        # Each element touched pulls in a full cache line once the stride
+        # exceeds the line size; report the useful-byte bandwidth.
+        bandwidth = nelem * 8 / sarr_time / 1e9
+        if counts is None:
+            cyc = miss = "-"
+        else:
+            cyc = "{:.2f}".format(counts["cycles"])
+            miss = "{:.4f}".format(counts["cache_misses"])
+        print("{:>8} {:>10} {:>12.3f} {:>12.3f} {:>8.2f} {:>12.2f} "
+              "{:>10} {:>10}".format(
+                  stride, nelem, np_time * 1e3, sarr_time * 1e3,
+                  np_time / sarr_time, bandwidth, cyc, miss))
+
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
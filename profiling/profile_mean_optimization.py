@@ -0,0 +1,108 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Validate SimpleArray.mean() against NumPy and profile it with the
+builtin call profiler.
+"""
+
+
+import numpy as np
+
+import modmesh
+
+from _prof_utils import autoscale
+from _prof_utils import print_tree
+from _prof_utils import time_burst
+
+# One random pool generated at import; every helper slices a prefix
+# view of it instead of regenerating its own array.
+MAX_SIZE = 1000000
+_BIG64 = np.random.rand(MAX_SIZE)
+
+
+def validate_mean():
+    print("Validation against np.mean:")
+    for size in (10, 1000, 100000, 1000000):
+        nparr = _BIG64[:size]
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+        expected = np.mean(nparr)
+        got = sarr.mean()
+        ok = np.isclose(got, expected, rtol=1e-10)
+        print("  size {:>8}: np {:.15f} sarr {:.15f} {}".format(
+            size, expected, got, "OK" if ok else "MISMATCH"))
+        if not ok:
+            raise ValueError("mean mismatch at size {}".format(size))
+
+
+def profile_with_callprofiler(size, num_iterations):
+    sarr = modmesh.SimpleArrayFloat64(array=_BIG64[:size])
+
+    modmesh.call_profiler.reset()
+    # The probe stops when it is garbage-collected.
+    probe = modmesh.CallProfilerProbe("mean_loop")
+    sarr.mean_repeat(num_iterations)
+    del probe
+
+    result = modmesh.call_profiler.result()
+    print("Call profiler tree ({} elements, {} calls):".format(
+        size, num_iterations))
+    print_tree(result)
+
+
+def profile_mean(size):
+    nparr = _BIG64[:size]
+    sarr = modmesh.SimpleArrayFloat64(array=nparr)
+
+    np_iters = autoscale(nparr.mean)
+
+    def np_burst():
+        for _ in range(np_iters):
+            nparr.mean()
+
+    np_time = time_burst(np_burst) / np_iters
+
+    sarr_iters = autoscale(sarr.mean)
+    sarr_time = time_burst(
+        lambda: sarr.mean_repeat(sarr_iters)) / sarr_iters
+
+    print("size {:>8}: np {:.3f} us, sarr {:.3f} us, ratio {:.2f}".format(
+        size, np_time * 1e6, sarr_time * 1e6, np_time / sarr_time))
+
+
+def main():
+    validate_mean()
+    print()
+    for size in (1000, 100000, 1000000):
+        profile_mean(size)
+    print()
+    profile_with_callprofiler(size=1000000, num_iterations=100)
+
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
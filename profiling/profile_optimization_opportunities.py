@@ -0,0 +1,80 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Scan SimpleArray.mean() across a range of small sizes to locate where
+the per-call overhead crosses over into the bandwidth-bound regime.
+"""
+
+
+import numpy as np
+
+import modmesh
+
+from _prof_utils import autoscale
+from _prof_utils import time_burst
+
+# One random pool generated at import; each scanned size slices a
+# prefix view of it.
+MAX_SIZE = 65536
+_BIG64 = np.random.rand(MAX_SIZE)
+
+
+def measure_call_cost(size):
+    nparr = _BIG64[:size]
+    sarr = modmesh.SimpleArrayFloat64(array=nparr)
+
+    sarr_iters = autoscale(sarr.mean)
+    sarr_time = time_burst(
+        lambda: sarr.mean_repeat(sarr_iters)) / sarr_iters
+
+    np_iters = autoscale(nparr.mean)
+
+    def np_burst():
+        for _ in range(np_iters):
+            nparr.mean()
+
+    np_time = time_burst(np_burst) / np_iters
+
+    return np_time, sarr_time
+
+
+def main():
+    print("Small-size overhead scan (per-call cost):")
+    print("{:>8} {:>12} {:>12} {:>10}".format(
+        "size", "np (us)", "sarr (us)", "ns/elem"))
+    size = 1
+    while size <= 65536:
+        np_time, sarr_time = measure_call_cost(size)
+        print("{:>8} {:>12.3f} {:>12.3f} {:>10.2f}".format(
+            size, np_time * 1e6, sarr_time * 1e6, sarr_time * 1e9 / size))
+        size *= 4
+
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
@@ -0,0 +1,293 @@
+# Copyright (c) 2025, Yung-Yu Chen <yyc@solvcon.net>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import gc
+import time
+import unittest
+
+import numpy as np
+
+import modmesh
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+if nb is not None:
+    @nb.njit(parallel=True, fastmath=True)
+    def numba_mean(a):
+        s = 0.0
+        for i in nb.prange(a.shape[0]):
+            s += a[i]
+        return s / a.shape[0]
+
+
+class TimeBufferTC(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Fill a 4-dimensional array with the digit-scaled index value
+        # i*1000 + j*100 + k*10 + l so that every element is unique and
+        # the position is recoverable from the value.  Building the
+        # fixture once per class keeps the construction cost out of the
+        # individual tests.
+        ind = np.indices((5, 5, 5, 5))
+        cls.a = (ind[0] * 1000 + ind[1] * 100 + ind[2] * 10
+                 + ind[3]).astype('float64')
+        cls.b = modmesh.SimpleArrayFloat64(array=cls.a)
+
+    def test_multi_dimension_round_trip(self):
+        self.assertEqual((5, 5, 5, 5), self.b.shape)
+        # A single vectorized comparison covers all 625 elements; no
+        # per-element Python loop is needed.
+        np.testing.assert_array_equal(self.b.ndarray, self.a)
+
+    def test_mean_axis(self):
+        a = self.a
+        b = self.b
+
+        for axis in range(4):
+            reduced = b.mean_axis(axis)
+            self.assertEqual((5, 5, 5), reduced.shape)
+            np.testing.assert_allclose(reduced.ndarray, a.mean(axis=axis))
+
+        # Reducing a 1-d array yields a single-element array.
+        nparr = np.arange(10, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+        reduced = sarr.mean_axis(0)
+        self.assertEqual((1,), reduced.shape)
+        self.assertAlmostEqual(nparr.mean(), reduced[0], places=10)
+
+        with self.assertRaisesRegex(
+                IndexError, "mean_axis axis 4 is out of bounds"):
+            b.mean_axis(4)
+
+
+class SimpleArrayStridedTC(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base1d = np.arange(1000, dtype='float64')
+        cls.base2d = np.arange(1200, dtype='float64').reshape((30, 40))
+        cls.base3d = np.arange(8000, dtype='float64').reshape((20, 20, 20))
+        # The million-element pool is allocated once; the tests using it
+        # only take O(1) slices, keeping the allocator and page faults
+        # out of anything resembling a timed region.
+        cls.big = np.random.rand(1000000)
+
+    def check_mean(self, npview):
+        # The constructor copies non-contiguous input, so mean_of_view,
+        # which aliases the view in place, is asserted as well to keep
+        # the strided kernels covered.  Those kernels sum pairwise with
+        # Kahan-compensated run accumulation, so no extra slack over the
+        # contiguous path is needed even on the million-element views.
+        sarr = modmesh.SimpleArrayFloat64(array=npview)
+        self.assertAlmostEqual(npview.mean(), sarr.mean(), places=12)
+        self.assertAlmostEqual(npview.mean(), modmesh.mean_of_view(npview),
+                               places=12)
+
+    # Each slicing case is a discrete test method rather than one method
+    # looping over cases: a failure then names the exact layout, and a
+    # parallel runner (pytest -n auto) can spread the cases over cores.
+
+    def test_1d_strided_step2(self):
+        self.check_mean(self.base1d[::2])
+
+    def test_1d_strided_step3(self):
+        self.check_mean(self.base1d[::3])
+
+    def test_1d_strided_step5(self):
+        self.check_mean(self.base1d[::5])
+
+    def test_1d_strided_step7(self):
+        self.check_mean(self.base1d[::7])
+
+    def test_2d_strided_axis0(self):
+        self.check_mean(self.base2d[::2])
+
+    def test_2d_strided_axis1(self):
+        self.check_mean(self.base2d[:, ::3])
+
+    def test_2d_strided_both_axes(self):
+        self.check_mean(self.base2d[::2, ::3])
+
+    def test_3d_strided_axis0(self):
+        self.check_mean(self.base3d[::2])
+
+    def test_3d_strided_axis1(self):
+        self.check_mean(self.base3d[:, ::3, :])
+
+    def test_3d_strided_all_axes(self):
+        self.check_mean(self.base3d[::2, ::3, ::5])
+
+    def test_mixed_strided_2d_offset(self):
+        # A non-zero offset combined with per-axis steps.
+        self.check_mean(self.base2d[1:, ::2])
+
+    def test_mixed_strided_3d_offset(self):
+        self.check_mean(self.base3d[2:, 1::3, ::2])
+
+    def test_contiguous_vs_non_contiguous(self):
+        contiguous = modmesh.SimpleArrayFloat64(array=self.base1d)
+        strided = modmesh.SimpleArrayFloat64(array=self.base1d[::1])
+        self.assertTrue(contiguous.is_c_contiguous)
+        # The constructor copies non-contiguous input into a contiguous
+        # array; only internal views (stride_view) stay non-contiguous.
+        self.assertTrue(
+            modmesh.SimpleArrayFloat64(
+                array=self.base1d[::7]).is_c_contiguous)
+        self.assertFalse(contiguous.stride_view(7).is_c_contiguous)
+        self.assertAlmostEqual(contiguous.mean(), strided.mean(),
+                               places=12)
+        # A stride-1 view of every element must agree with the copy of
+        # the strided subset.
+        subset = np.ascontiguousarray(self.base1d[::7])
+        self.assertAlmostEqual(
+            modmesh.SimpleArrayFloat64(array=self.base1d[::7]).mean(),
+            modmesh.SimpleArrayFloat64(array=subset).mean(),
+            places=10)
+
+    def test_interleaved_layout(self):
+        # Axes whose strides interleave in memory (outer stride smaller
+        # than the inner run footprint) exercise the tiled traversal.
+        view = np.lib.stride_tricks.as_strided(
+            self.base1d, shape=(2, 500), strides=(8, 16))
+        self.check_mean(view)
+
+    def test_large_strided_array(self):
+        self.check_mean(self.big[::7])
+
+    def test_performance_comparison(self):
+        nparr = self.big
+        contiguous = modmesh.SimpleArrayFloat64(array=nparr)
+        strided = modmesh.SimpleArrayFloat64(array=nparr[::7])
+
+        # Warm up both paths first so page faults, CPUID dispatch, and
+        # branch-predictor training stay out of the measured window.
+        contiguous.mean()
+        strided.mean()
+
+        # Batch the repetition on the C++ side so the window measures
+        # the kernels rather than 100 interpreter round trips, use the
+        # monotonic nanosecond clock, and keep the garbage collector
+        # from pausing inside the window.
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter_ns()
+            contiguous.mean_repeat(100)
+            t1 = time.perf_counter_ns()
+            strided.mean_repeat(100)
+            t2 = time.perf_counter_ns()
+        finally:
+            gc.enable()
+        contiguous_ns = (t1 - t0) / 100
+        strided_ns = (t2 - t1) / 100
+        self.assertGreater(contiguous_ns, 0)
+        self.assertGreater(strided_ns, 0)
+
+        # The timings are informational; only correctness is asserted.
+        self.assertAlmostEqual(nparr.mean(), contiguous.mean(), places=10)
+        self.assertAlmostEqual(nparr[::7].mean(), strided.mean(),
+                               places=10)
+
+    def test_from_ndarray(self):
+        # The positional static constructor shares the aliasing path
+        # with the keyword form but skips the __init__ overload chain.
+        # Contiguous input is aliased: writes are shared both ways.
+        nparr = np.arange(10, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64.from_ndarray(nparr)
+        self.assertAlmostEqual(nparr.mean(), sarr.mean(), places=12)
+        nparr[3] = -777.0
+        self.assertEqual(-777.0, sarr[3])
+        sarr[3] = 3.0
+        self.assertEqual(3.0, nparr[3])
+
+        # Non-contiguous input is copied into a contiguous array, so
+        # every accessor sees only the selected elements and writes
+        # stay isolated from the source view.
+        view = nparr[::3]
+        sarr = modmesh.SimpleArrayFloat64.from_ndarray(view)
+        self.assertTrue(sarr.is_c_contiguous)
+        self.assertEqual((4,), sarr.shape)
+        self.assertEqual(18.0, sarr.sum())
+        self.assertEqual(0.0, sarr.min())
+        self.assertEqual(9.0, sarr.max())
+        self.assertEqual(3.0, sarr[1])
+        sarr.fill(0.0)
+        np.testing.assert_array_equal(np.arange(10, dtype='float64'),
+                                      nparr)
+
+    def test_mean_of_view(self):
+        # The free function reduces a view in one call without
+        # materializing a Python-side SimpleArray wrapper.
+        self.assertAlmostEqual(self.base1d[::7].mean(),
+                               modmesh.mean_of_view(self.base1d[::7]),
+                               places=12)
+        self.assertAlmostEqual(self.big.mean(),
+                               modmesh.mean_of_view(self.big),
+                               places=12)
+        f32 = self.base1d.astype('float32')
+        self.assertAlmostEqual(f32.mean(),
+                               modmesh.mean_of_view(f32),
+                               places=4)
+        with self.assertRaisesRegex(RuntimeError, "unsupported dtype"):
+            modmesh.mean_of_view(np.ones(4, dtype='complex128'))
+
+    @unittest.skipIf(nb is None, "numba is not installed")
+    def test_numba_reference(self):
+        # A parallel fastmath reduction rounds differently from both
+        # numpy and our kernels; agreement with it cross-checks the
+        # kernels against an oracle independent of numpy's ordering.
+        for view in (self.big, self.big[::7]):
+            sarr = modmesh.SimpleArrayFloat64(array=view)
+            self.assertAlmostEqual(numba_mean(view), sarr.mean(),
+                                   places=9)
+
+    def test_reverse_strided_array(self):
+        # Negative strides fall back to a contiguous copy in the
+        # constructor; the mean must still match.
+        self.check_mean(self.base1d[::-1])
+        self.check_mean(self.base2d[::-1, ::2])
+
+    def test_edge_cases(self):
+        # Single element.
+        self.check_mean(self.base1d[:1])
+        # Step larger than the extent leaves one element.
+        self.check_mean(self.base1d[::2000])
+        # A view whose first axis is 1 keeps the trailing axis strided.
+        self.check_mean(self.base2d[:1, ::3])
+        # Nine axes exceed the stack-resident metadata span and take the
+        # axis-peeling path.
+        deep = np.arange(512, dtype='float64').reshape((2,) * 9)
+        self.check_mean(deep[..., ::2])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: set ff=unix fenc=utf8 et sw=4 ts=4 sts=4:
@@ -702,6 +702,75 @@ class SimpleArrayBasicTC(unittest.TestCase):
         self.assertEqual(sarr[0, 0], 1)
         self.assertEqual(sarr[0, 1], 2)
 
+    def test_SimpleArray_from_noncontiguous_ndarray(self):
+        # Non-contiguous input is copied, not aliased: the flat
+        # accessors (sum, min, max, indexing, fill) walk the whole
+        # buffer and would otherwise see elements outside the view.
+        base = np.arange(10, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=base[::3])
+        self.assertEqual((4,), sarr.shape)
+        self.assertEqual(4, sarr.size)
+        self.assertTrue(sarr.is_c_contiguous)
+        self.assertEqual(18.0, sarr.sum())
+        self.assertEqual(0.0, sarr.min())
+        self.assertEqual(9.0, sarr.max())
+        self.assertEqual(3.0, sarr[1])
+
+        # The copy isolates writes from the base ndarray.
+        sarr[1] = -1.0
+        self.assertEqual(3.0, base[3])
+        sarr.fill(0.0)
+        np.testing.assert_array_equal(np.arange(10, dtype='float64'), base)
+
+        # The minimum comes from the viewed elements only, not from
+        # elements the view skips over.
+        sarr = modmesh.SimpleArrayFloat64(
+            array=np.array([5.0, -9.0, 5.0, 5.0])[::2])
+        self.assertEqual(5.0, sarr.min())
+
+    def test_SimpleArray_stride_view(self):
+        nparr = np.arange(10, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+
+        view = sarr.stride_view(3)
+        self.assertEqual((4,), view.shape)
+        self.assertEqual((3,), view.stride)
+        np.testing.assert_array_equal(view.ndarray, nparr[::3])
+
+        # The view shares the buffer; writing through the view's ndarray
+        # is visible in the base array.
+        view.ndarray[1] = 100.0
+        self.assertEqual(100.0, sarr[3])
+        view.ndarray[1] = 3.0
+
+        # The calculators and element access follow the view's shape and
+        # stride, not the underlying buffer extent.
+        self.assertEqual(18.0, view.sum())
+        self.assertEqual(0.0, view.min())
+        self.assertEqual(9.0, view.max())
+        self.assertEqual(3.0, view[1])
+        with self.assertRaisesRegex(
+                IndexError, "index 4 >= number of elements 4"):
+            view[4]
+
+        # Writing through the view touches only the selected elements.
+        view[1] = 300.0
+        self.assertEqual(300.0, nparr[3])
+        view.fill(0.0)
+        np.testing.assert_array_equal(
+            [0.0, 1.0, 2.0, 0.0, 4.0, 5.0, 0.0, 7.0, 8.0, 0.0], nparr)
+
+        # Views along the first axis keep the trailing axes intact.
+        nparr = np.arange(24, dtype='float64').reshape((6, 4))
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+        view = sarr.stride_view(2)
+        self.assertEqual((3, 4), view.shape)
+        np.testing.assert_array_equal(view.ndarray, nparr[::2])
+
+        with self.assertRaisesRegex(
+                IndexError, "stride_view step cannot be 0"):
+            sarr.stride_view(0)
+
     @unittest.skipUnless(modmesh.testhelper.PYTEST_HELPER_BINDING_BUILT,
                          "TestSimpleArrayHelper is not built")
     def test_SimpleArray_casting(self):
@@ -788,6 +857,57 @@ class SimpleArrayCalculatorsTC(unittest.TestCase):
         self.assertEqual(sarr.min(), -2.3)
         self.assertEqual(sarr.max(), 9.2)
 
+    def test_mean(self):
+        sarr = modmesh.SimpleArrayFloat64(shape=(2, 4), value=10.0)
+        self.assertEqual(sarr.mean(), 10.0)
+
+        nparr = np.arange(1000, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=nparr)
+        self.assertAlmostEqual(sarr.mean(), nparr.mean(), places=10)
+
+        nparr = np.arange(1000, dtype='float32')
+        sarr = modmesh.SimpleArrayFloat32(array=nparr)
+        self.assertAlmostEqual(sarr.mean(), nparr.mean(), places=3)
+
+        # Exercise every unrolled small-size fast path plus the first
+        # size beyond it.
+        nparr = np.random.rand(33)
+        for n in range(1, 34):
+            sarr = modmesh.SimpleArrayFloat64(array=nparr[:n])
+            self.assertAlmostEqual(sarr.mean(), nparr[:n].mean(),
+                                   places=12)
+
+        # Pairwise summation keeps large float32 reductions within the
+        # error envelope of NumPy, which uses the same cascaded scheme.
+        nparr = np.random.rand(1000000).astype('float32')
+        sarr = modmesh.SimpleArrayFloat32(array=nparr)
+        self.assertAlmostEqual(sarr.mean(), float(nparr.mean()), places=5)
+
+        # Non-contiguous views are copied into a contiguous array and
+        # averaged over the viewed elements only.
+        nparr = np.arange(100, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=nparr[::3])
+        self.assertTrue(sarr.is_from_python)
+        self.assertAlmostEqual(sarr.mean(), nparr[::3].mean(), places=10)
+
+        nparr = np.arange(120, dtype='float64').reshape((10, 12))
+        sarr = modmesh.SimpleArrayFloat64(array=nparr[::2, ::3])
+        self.assertAlmostEqual(sarr.mean(), nparr[::2, ::3].mean(),
+                               places=10)
+
+        # Negative strides take the same contiguous-copy path.
+        nparr = np.arange(100, dtype='float64')
+        sarr = modmesh.SimpleArrayFloat64(array=nparr[::-1])
+        self.assertAlmostEqual(sarr.mean(), nparr.mean(), places=10)
+
+        # Integer mean truncates like C++ integer division.
+        sarr = modmesh.SimpleArrayInt64(shape=4)
+        sarr[0] = 1
+        sarr[1] = 2
+        sarr[2] = 2
+        sarr[3] = 2
+        self.assertEqual(sarr.mean(), 1)
+
     def test_abs(self):
         sarr = modmesh.SimpleArrayInt64(shape=(3, 2), value=-2)
         self.assertEqual(sarr.sum(), -2 * 3 * 2)
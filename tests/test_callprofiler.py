@@ -92,6 +92,22 @@ class CallProfilerTC(unittest.TestCase):
         except jsonschema.ValidationError as e:
             self.fail(f"JSON data is invalid: {e.message}")
 
+    def test_result_mutation_isolated(self):
+
+        @profile_function
+        def foo():
+            busy_loop(0.01)
+
+        modmesh.call_profiler.reset()
+        foo()
+        # Each call returns a fresh tree; mutating one must not leak
+        # into the cached copy handed out by later calls.
+        result = modmesh.call_profiler.result()
+        result["children"] = []
+        result2 = modmesh.call_profiler.result()
+        self.assertEqual(len(result2["children"]), 1)
+        self.assertEqual(result2["children"][0]["name"], "foo")
+
     def test_single_function_profiling(self):
 
         @profile_function